@@ -33,6 +33,7 @@ from enum import Enum
 from decimal import Decimal
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import lambda_stmt, select
 
 logger = logging.getLogger("flask.app")
 
@@ -45,6 +46,13 @@ def init_db(app):
     Product.init_db(app)
 
 
+def _price_value(price) -> Decimal:
+    """Converts a price that may arrive as a (quoted) string into a Decimal"""
+    if isinstance(price, str):
+        return Decimal(price.strip(' "'))
+    return price
+
+
 class DataValidationError(Exception):
     """Used for an data validation errors when deserializing"""
 
@@ -175,6 +183,18 @@ class Product(db.Model):
         logger.info("Processing all Products")
         return cls.query.all()
 
+    @classmethod
+    def all_ids(cls) -> list:
+        """Returns the ids of all of the Products in the database"""
+        logger.info("Processing ids of all Products")
+        return [row[0] for row in db.session.execute(select(cls.id)).all()]
+
+    @classmethod
+    def count(cls) -> int:
+        """Returns the number of Products in the database"""
+        logger.info("Processing count of all Products")
+        return cls.query.count()
+
     @classmethod
     def find(cls, product_id: int):
         """Finds a Product by it's ID
@@ -187,7 +207,7 @@ class Product(db.Model):
 
         """
         logger.info("Processing lookup for id %s ...", product_id)
-        return cls.query.get(product_id)
+        return db.session.get(cls, product_id)
 
     @classmethod
     def find_by_name(cls, name: str) -> list:
@@ -201,7 +221,10 @@ class Product(db.Model):
 
         """
         logger.info("Processing name query for %s ...", name)
-        return cls.query.filter(cls.name == name).all()
+        # lambda statements are compiled once and reused from the statement cache
+        stmt = lambda_stmt(lambda: select(cls))
+        stmt += lambda s: s.where(cls.name == name)
+        return db.session.scalars(stmt).all()
 
     @classmethod
     def find_by_price(cls, price: Decimal) -> list:
@@ -215,10 +238,10 @@ class Product(db.Model):
 
         """
         logger.info("Processing price query for %s ...", price)
-        price_value = price
-        if isinstance(price, str):
-            price_value = Decimal(price.strip(' "'))
-        return cls.query.filter(cls.price == price_value).all()
+        price_value = _price_value(price)
+        stmt = lambda_stmt(lambda: select(cls))
+        stmt += lambda s: s.where(cls.price == price_value)
+        return db.session.scalars(stmt).all()
 
     @classmethod
     def find_by_availability(cls, available: bool = True) -> list:
@@ -232,7 +255,9 @@ class Product(db.Model):
 
         """
         logger.info("Processing available query for %s ...", available)
-        return cls.query.filter(cls.available == available).all()
+        stmt = lambda_stmt(lambda: select(cls))
+        stmt += lambda s: s.where(cls.available == available)
+        return db.session.scalars(stmt).all()
 
     @classmethod
     def find_by_category(cls, category: Category = Category.UNKNOWN) -> list:
@@ -246,4 +271,62 @@ class Product(db.Model):
 
         """
         logger.info("Processing category query for %s ...", category.name)
-        return cls.query.filter(cls.category == category).all()
+        stmt = lambda_stmt(lambda: select(cls))
+        stmt += lambda s: s.where(cls.category == category)
+        return db.session.scalars(stmt).all()
+
+    @classmethod
+    def count_by_name(cls, name: str) -> int:
+        """Returns the number of Products with the given name
+
+        :param name: the name of the Products you want to match
+        :type name: str
+
+        :return: the number of Products with that name
+        :rtype: int
+
+        """
+        logger.info("Processing name count for %s ...", name)
+        return cls.query.filter(cls.name == name).count()
+
+    @classmethod
+    def count_by_price(cls, price: Decimal) -> int:
+        """Returns the number of Products with the given price
+
+        :param price: the price to search for
+        :type price: Decimal
+
+        :return: the number of Products with that price
+        :rtype: int
+
+        """
+        logger.info("Processing price count for %s ...", price)
+        return cls.query.filter(cls.price == _price_value(price)).count()
+
+    @classmethod
+    def count_by_availability(cls, available: bool = True) -> int:
+        """Returns the number of Products by their availability
+
+        :param available: True for products that are available
+        :type available: bool
+
+        :return: the number of Products with that availability
+        :rtype: int
+
+        """
+        logger.info("Processing available count for %s ...", available)
+        return cls.query.filter(cls.available == available).count()
+
+    @classmethod
+    def count_by_category(cls, category: Category = Category.UNKNOWN) -> int:
+        """Returns the number of Products by their Category
+
+        :param category: the Category to match
+        :type category: Category
+
+        :return: the number of Products in that Category
+        :rtype: int
+
+        """
+        logger.info("Processing category count for %s ...", category.name)
+        return cls.query.filter(cls.category == category).count()